@@ -1,5 +1,6 @@
-from datetime import datetime
+import asyncio
 import time
+from datetime import date, datetime
 from google.adk.agents import Agent
 # NOTE: google_search and built_in_code_execution are NOT supported with gemini-2.0-flash
 # Error: "Code execution and search tool is not supported"
@@ -10,6 +11,23 @@ from google.adk.tools.long_running_tool import LongRunningFunctionTool
 # with the standard Gemini API. They require Vertex AI or enterprise features.
 # However, you CAN create custom tools and long-running tools! ✅
 
+# ==================== Formats ====================
+
+_FMT_DT = "%Y-%m-%d %H:%M:%S"
+_FMT_D = "%Y-%m-%d"
+
+# Clock functions bound once (one global lookup per call, no attribute access)
+_clock = time.time
+_today = date.today
+
+# Last result of each datetime tool as a (key, result) tuple; repeated calls
+# within the same second (time) or day (date) reuse it instead of reformatting.
+# Replaced in one assignment, so a tool running in another thread never sees
+# a new key paired with the old result.
+_time_cache = (None, None)
+_date_cache = (None, None)
+
+
 # ==================== Custom Tools ====================
 
 def get_current_time() -> dict:
@@ -19,9 +37,15 @@ def get_current_time() -> dict:
     Returns:
         dict: Contains the current_time string
     """
-    return {
-        "current_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    }
+    global _time_cache
+    second = int(_clock())
+    key, result = _time_cache
+    if key != second:
+        result = {
+            "current_time": datetime.fromtimestamp(second).strftime(_FMT_DT),
+        }
+        _time_cache = (second, result)
+    return result
 
 
 def get_date_info() -> dict:
@@ -31,20 +55,41 @@ def get_date_info() -> dict:
     Returns:
         dict: Contains date, day_of_week, month, year, day_of_year
     """
-    now = datetime.now()
-    return {
-        "date": now.strftime("%Y-%m-%d"),
-        "day_of_week": now.strftime("%A"),
-        "month": now.strftime("%B"),
-        "year": now.year,
-        "day_of_year": now.timetuple().tm_yday,
-    }
+    global _date_cache
+    today = _today()
+    day = today.toordinal()
+    key, result = _date_cache
+    if key != day:
+        result = {
+            "date": today.strftime(_FMT_D),
+            "day_of_week": today.strftime("%A"),
+            "month": today.strftime("%B"),
+            "year": today.year,
+            "day_of_year": day - date(today.year, 1, 1).toordinal() + 1,
+        }
+        _date_cache = (day, result)
+    return result
+
+
+# ==================== Mock Data ====================
+# Built once at import so fetch_weather_data only does a lookup per call
+
+# Keys match the tool's response fields, so results are built in one step
+_DEFAULT_WEATHER = {"temperature_f": 70, "condition": "Clear", "humidity_percent": 60}
+
+_WEATHER = {
+    "new york": {"temperature_f": 72, "condition": "Sunny", "humidity_percent": 65},
+    "london": {"temperature_f": 58, "condition": "Cloudy", "humidity_percent": 78},
+    "tokyo": {"temperature_f": 68, "condition": "Rainy", "humidity_percent": 82},
+}
 
 
 # ==================== Long-running Tool Functions ====================
-# These are regular functions that will be wrapped in LongRunningFunctionTool
+# These are async functions that will be wrapped in LongRunningFunctionTool.
+# Awaiting asyncio.sleep (instead of time.sleep) keeps the event loop free,
+# so several long-running calls can overlap instead of blocking each other.
 
-def analyze_large_dataset(data_size: int) -> dict:
+async def analyze_large_dataset(data_size: int) -> dict:
     """
     Simulate analyzing a large dataset. This is a long-running operation.
     
@@ -58,7 +103,7 @@ def analyze_large_dataset(data_size: int) -> dict:
     
     # Simulate processing time (1 second per 1000 records)
     processing_time = min(data_size / 1000, 5)  # Cap at 5 seconds
-    time.sleep(processing_time)
+    await asyncio.sleep(processing_time)
     
     print(f"[LONG-RUNNING] Analysis complete!")
     
@@ -70,7 +115,7 @@ def analyze_large_dataset(data_size: int) -> dict:
     }
 
 
-def fetch_weather_data(city: str) -> dict:
+async def fetch_weather_data(city: str) -> dict:
     """
     Simulate fetching weather data from an external API (long-running operation).
     
@@ -83,53 +128,47 @@ def fetch_weather_data(city: str) -> dict:
     print(f"[LONG-RUNNING] Fetching weather data for {city}...")
     
     # Simulate API call delay
-    time.sleep(2)
-    
-    # Mock weather data
-    weather_mock = {
-        "new york": {"temp": 72, "condition": "Sunny", "humidity": 65},
-        "london": {"temp": 58, "condition": "Cloudy", "humidity": 78},
-        "tokyo": {"temp": 68, "condition": "Rainy", "humidity": 82},
-        "default": {"temp": 70, "condition": "Clear", "humidity": 60},
-    }
-    
-    weather = weather_mock.get(city.lower(), weather_mock["default"])
+    await asyncio.sleep(2)
     
     print(f"[LONG-RUNNING] Weather data retrieved!")
     
     return {
         "city": city,
-        "temperature_f": weather["temp"],
-        "condition": weather["condition"],
-        "humidity_percent": weather["humidity"],
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        **_WEATHER.get(city.casefold(), _DEFAULT_WEATHER),
+        "timestamp": datetime.now().strftime(_FMT_DT),
     }
 
 
 # ==================== Agent Configuration ====================
 
+# Static system instruction, kept as one constant so every turn sends an
+# identical prefix (eligible for provider-side prompt caching)
+_INSTRUCTION = """
+You are a helpful assistant with multiple tools at your disposal:
+
+**Time & Date Tools:**
+- get_current_time: Get the current time in YYYY-MM-DD HH:MM:SS format
+- get_date_info: Get detailed date information (day of week, month, year, day of year)
+
+**Long-running Tools (these take time, inform user):**
+- analyze_large_dataset: Analyze large datasets (simulation, takes 1-5 seconds)
+- fetch_weather_data: Fetch weather information (simulation, takes 2 seconds)
+
+When using long-running tools, let the user know that the operation 
+will take a few moments to complete.
+
+You can combine multiple tools to answer complex queries!
+When you need multiple independent pieces of information, call all the
+relevant tools in a single response so they run in parallel.
+
+NOTE: You do NOT have access to web search or code execution tools.
+"""
+
 root_agent = Agent(
     name="tool_agent",
     model="gemini-2.0-flash",
     description="Advanced tool agent with datetime and long-running capabilities",
-    instruction="""
-    You are a helpful assistant with multiple tools at your disposal:
-    
-    **Time & Date Tools:**
-    - get_current_time: Get the current time in YYYY-MM-DD HH:MM:SS format
-    - get_date_info: Get detailed date information (day of week, month, year, day of year)
-    
-    **Long-running Tools (these take time, inform user):**
-    - analyze_large_dataset: Analyze large datasets (simulation, takes 1-5 seconds)
-    - fetch_weather_data: Fetch weather information (simulation, takes 2 seconds)
-    
-    When using long-running tools, let the user know that the operation 
-    will take a few moments to complete.
-    
-    You can combine multiple tools to answer complex queries!
-    
-    NOTE: You do NOT have access to web search or code execution tools.
-    """,
+    instruction=_INSTRUCTION,
     tools=[
         # Custom datetime tools (regular functions)
         get_current_time,
@@ -145,12 +184,26 @@ root_agent = Agent(
 # ✅ YES: Custom tools work perfectly!
 # ✅ YES: Long-running tools work with LongRunningFunctionTool wrapper
 # ℹ️  INFO: Built-in tools require Vertex AI or enterprise API access
+# ℹ️  INFO: The long-running tools are async, so when the model asks for several
+#    of them in one response they can overlap instead of running back-to-back
+#    (only on ADK releases that run a response's function calls concurrently;
+#    the pinned google-adk 0.3.0 runs them one at a time)
 # 
 # How to use long-running tools:
-# 1. Define a regular function with proper docstring and type hints
+# 1. Define a function (sync or async) with proper docstring and type hints
 # 2. Wrap it with LongRunningFunctionTool(your_function)
 # 3. Add to the tools list
 # 
+# If a long-running tool must call blocking (sync-only) code, don't call it
+# directly from the async tool - that stalls the event loop. Offload it to one
+# shared, bounded thread pool instead of spawning a thread per call:
+#     from concurrent.futures import ThreadPoolExecutor
+#     _POOL = ThreadPoolExecutor(max_workers=8)
+#
+#     async def my_tool(x: int) -> dict:
+#         loop = asyncio.get_running_loop()
+#         return await loop.run_in_executor(_POOL, blocking_impl, x)
+# 
 # Common issues that might prevent multiple tools from working:
 # 1. Missing docstrings (LLM needs them to understand the tool)
 # 2. Missing type hints on function parameters
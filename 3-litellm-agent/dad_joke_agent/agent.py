@@ -1,6 +1,7 @@
 import os
 import random
 
+import litellm
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
@@ -8,6 +9,11 @@ from google.adk.models.lite_llm import LiteLlm
 # LiteLLM allows you to use ANY LLM provider with a unified interface!
 # https://docs.litellm.ai/docs/providers
 
+# In-memory response cache: an identical request (same model, instruction and
+# conversation) is answered from memory instead of making another LLM call.
+# https://docs.litellm.ai/docs/caching/all_caches
+litellm.enable_cache()
+
 # OPTION 1: Google Gemini (using your existing API key) ✅ RECOMMENDED
 model = LiteLlm(
     model="gemini/gemini-2.0-flash-exp",  # gemini/ prefix for LiteLLM
@@ -42,23 +48,31 @@ model = LiteLlm(
 # Learn more: https://docs.litellm.ai/docs/providers
 
 
+# Built once at import; the tool only picks an index per call
+_JOKES = (
+    "Why did the chicken cross the road? To get to the other side!",
+    "What do you call a belt made of watches? A waist of time.",
+    "What do you call fake spaghetti? An impasta!",
+    "Why did the scarecrow win an award? Because he was outstanding in his field!",
+)
+_pick = random.randrange
+
+
 def get_dad_joke():
-    jokes = [
-        "Why did the chicken cross the road? To get to the other side!",
-        "What do you call a belt made of watches? A waist of time.",
-        "What do you call fake spaghetti? An impasta!",
-        "Why did the scarecrow win an award? Because he was outstanding in his field!",
-    ]
-    return random.choice(jokes)
+    return _JOKES[_pick(len(_JOKES))]
+
 
+# Byte-identical on every turn, so litellm's cache and the provider's
+# prefix cache can both match it
+_INSTRUCTION = """
+You are a helpful assistant that can tell dad jokes. 
+Only use the tool `get_dad_joke` to tell jokes.
+"""
 
 root_agent = Agent(
     name="dad_joke_agent",
     model=model,
     description="Dad joke agent",
-    instruction="""
-    You are a helpful assistant that can tell dad jokes. 
-    Only use the tool `get_dad_joke` to tell jokes.
-    """,
+    instruction=_INSTRUCTION,
     tools=[get_dad_joke],
 )
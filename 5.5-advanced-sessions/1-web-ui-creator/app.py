@@ -7,21 +7,44 @@ A beautiful Streamlit interface for creating and managing ADK sessions.
 import streamlit as st
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 
+# Optional: orjson decodes/encodes JSON several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 ADK_BASE_URL = "http://localhost:8000"
 AGENT_ID = "dynamic_session_agent"
+MAX_STORED_SESSIONS = 20    # Keep only the most recent sessions in memory
+MAX_RENDERED_SESSIONS = 10  # Sessions rendered unless "Show all" is on
+REQUEST_TIMEOUT = (2, 10)   # (connect, read) seconds - fail fast on a dead port
 
-# Page config
-st.set_page_config(
-    page_title="ADK Session Creator",
-    page_icon="🎯",
-    layout="wide"
-)
 
-# Custom CSS
-st.markdown("""
+@st.cache_resource
+def get_http() -> requests.Session:
+    """Pooled HTTP session shared across reruns (keeps connections alive)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def to_json_text(data: Dict[str, Any]) -> str:
+    """Pretty-print a dict as JSON text (for st.code)"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@st.cache_data
+def _css() -> str:
+    """Custom CSS, built once and reused on every rerun"""
+    return """
 <style>
     .stButton>button {
         width: 100%;
@@ -37,7 +60,43 @@ st.markdown("""
         margin: 0.25rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_data
+def _presets() -> Dict[str, Dict[str, str]]:
+    """Quick-preset users for the sidebar"""
+    return {
+        "👩‍💻 Alice (Developer)": {
+            "user_id": "alice",
+            "user_name": "Alice Johnson",
+            "user_email": "alice@devcompany.com",
+            "user_preferences": "Software engineer specializing in Python. Loves building AI applications and enjoys learning about new technologies."
+        },
+        "👨‍🔬 Bob (Data Scientist)": {
+            "user_id": "bob",
+            "user_name": "Bob Smith",
+            "user_email": "bob@datascience.io",
+            "user_preferences": "Data scientist with expertise in machine learning and statistics. Enjoys coffee and solving complex problems."
+        },
+        "👩‍🎓 Carol (Student)": {
+            "user_id": "carol",
+            "user_name": "Carol Martinez",
+            "user_email": "carol@university.edu",
+            "user_preferences": "Computer science student learning about AI. Needs help understanding concepts and completing assignments."
+        }
+    }
+
+
+# Page config
+st.set_page_config(
+    page_title="ADK Session Creator",
+    page_icon="🎯",
+    layout="wide"
+)
+
+# Custom CSS
+st.markdown(_css(), unsafe_allow_html=True)
 
 # Title
 st.title("🎯 Dynamic Session Creator")
@@ -47,29 +106,8 @@ st.markdown("**Create unique ADK sessions with custom user information**")
 st.sidebar.header("⚡ Quick Presets")
 st.sidebar.markdown("*Click to auto-fill form*")
 
-presets = {
-    "👩‍💻 Alice (Developer)": {
-        "user_id": "alice",
-        "user_name": "Alice Johnson",
-        "user_email": "alice@devcompany.com",
-        "user_preferences": "Software engineer specializing in Python. Loves building AI applications and enjoys learning about new technologies."
-    },
-    "👨‍🔬 Bob (Data Scientist)": {
-        "user_id": "bob",
-        "user_name": "Bob Smith",
-        "user_email": "bob@datascience.io",
-        "user_preferences": "Data scientist with expertise in machine learning and statistics. Enjoys coffee and solving complex problems."
-    },
-    "👩‍🎓 Carol (Student)": {
-        "user_id": "carol",
-        "user_name": "Carol Martinez",
-        "user_email": "carol@university.edu",
-        "user_preferences": "Computer science student learning about AI. Needs help understanding concepts and completing assignments."
-    }
-}
-
 # Preset buttons
-for preset_name, preset_data in presets.items():
+for preset_name, preset_data in _presets().items():
     if st.sidebar.button(preset_name, key=preset_name):
         st.session_state.update(preset_data)
         st.rerun()
@@ -139,17 +177,17 @@ with col1:
                 # Create session
                 try:
                     with st.spinner("Creating session..."):
-                        response = requests.post(
+                        response = get_http().post(
                             f"{ADK_BASE_URL}/sessions",
                             json={
                                 "agent_id": AGENT_ID,
                                 "state": state
                             },
-                            timeout=10
+                            timeout=REQUEST_TIMEOUT
                         )
                     
-                    if response.status_code == 200:
-                        session_data = response.json()
+                    if response.ok:
+                        session_data = orjson.loads(response.content) if orjson else response.json()
                         session_id = session_data["session_id"]
                         
                         # Store in session state
@@ -160,8 +198,11 @@ with col1:
                             "session_id": session_id,
                             "user_id": user_id,
                             "user_name": user_name,
-                            "state": state
+                            "state": state,
+                            # Serialized once here instead of on every rerun
+                            "state_json": to_json_text(state)
                         })
+                        st.session_state.created_sessions = st.session_state.created_sessions[-MAX_STORED_SESSIONS:]
                         
                         # Success message
                         st.success("✅ Session created successfully!")
@@ -186,7 +227,7 @@ with col1:
                                 del st.session_state[key]
                     else:
                         st.error(f"❌ Failed to create session: {response.status_code}")
-                        st.code(response.text)
+                        st.code(response.text[:1024])
                 
                 except requests.exceptions.ConnectionError:
                     st.error("❌ Cannot connect to ADK Web. Make sure it's running on port 8000!")
@@ -198,15 +239,27 @@ with col2:
     st.header("📊 Active Sessions")
     
     if "created_sessions" in st.session_state and st.session_state.created_sessions:
-        st.markdown(f"**Total Sessions:** {len(st.session_state.created_sessions)}")
+        sessions = st.session_state.created_sessions
+        st.markdown(f"**Total Sessions:** {len(sessions)}")
+        
+        # Only render the newest sessions unless asked for all of them
+        show_all = False
+        if len(sessions) > MAX_RENDERED_SESSIONS:
+            show_all = st.toggle(f"Show all ({len(sessions)})", value=False, key="show_all_sessions")
+        visible = sessions if show_all else sessions[-MAX_RENDERED_SESSIONS:]
         
-        for idx, session in enumerate(reversed(st.session_state.created_sessions)):
+        rendered_ids = set()
+        for idx, session in enumerate(reversed(visible)):
+            if session["session_id"] in rendered_ids:
+                continue
+            rendered_ids.add(session["session_id"])
+            
             with st.expander(f"👤 {session['user_name']} ({session['user_id']})"):
                 st.markdown(f"**Session ID:** `{session['session_id']}`")
                 
                 # Display state
                 st.markdown("**State:**")
-                st.json(session['state'])
+                st.code(session['state_json'], language="json")
                 
                 # Chat link
                 chat_url = f"{ADK_BASE_URL}/?session={session['session_id']}"
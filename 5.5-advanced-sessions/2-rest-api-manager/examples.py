@@ -5,17 +5,50 @@ Demonstrates all features of the SessionManager class.
 """
 
 from session_manager import SessionManager
+import asyncio
+import os
 import time
 
+# Upper bound on requests in flight at once during fan-out
+MAX_CONCURRENT_REQUESTS = 8
 
-def example_1_simple_chat():
+# Set EXAMPLES_SLOW=1 to pace the console output between steps
+SLOW = bool(os.getenv("EXAMPLES_SLOW"))
+
+
+def pause(seconds: float):
+    """Sleep only in slow mode; pauses exist purely for readability"""
+    if SLOW:
+        time.sleep(seconds)
+
+
+def run_concurrently(manager: SessionManager, coros: list) -> list:
+    """
+    Run coroutines concurrently, at most MAX_CONCURRENT_REQUESTS at a time.
+    
+    The manager's async client is closed before the event loop ends.
+    """
+    async def run_all():
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def run(coro):
+            async with semaphore:
+                return await coro
+        
+        try:
+            return await asyncio.gather(*(run(coro) for coro in coros))
+        finally:
+            await manager.aclose()
+    
+    return asyncio.run(run_all())
+
+
+def example_1_simple_chat(manager: SessionManager):
     """Example 1: Simple chat with one user"""
     print("=" * 60)
     print("EXAMPLE 1: Simple Chat")
     print("=" * 60)
     
-    manager = SessionManager()
-    
     # Create session
     print("\n📝 Creating session for Alice...")
     session_id = manager.create_session(
@@ -42,14 +75,12 @@ def example_1_simple_chat():
     print(f"\n🔗 Chat URL: {manager.get_chat_url(session_id)}")
 
 
-def example_2_multiple_users():
+def example_2_multiple_users(manager: SessionManager):
     """Example 2: Multiple users with different contexts"""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 2: Multiple Users")
     print("=" * 60)
     
-    manager = SessionManager()
-    
     # Create sessions for multiple users
     users = [
         {
@@ -69,16 +100,19 @@ def example_2_multiple_users():
         }
     ]
     
-    sessions = {}
-    
     print("\n📝 Creating sessions...")
-    for user in users:
-        session_id = manager.create_session(
+    session_ids = run_concurrently(manager, [
+        manager.acreate_session(
             agent_id="dynamic_session_agent",
             user_name=user["name"],
             user_email=user["email"],
             user_preferences=user["preferences"]
         )
+        for user in users
+    ])
+    
+    sessions = {}
+    for user, session_id in zip(users, session_ids):
         sessions[user["name"]] = session_id
         print(f"✅ {user['name']}: {session_id}")
     
@@ -88,33 +122,36 @@ def example_2_multiple_users():
     print(f"\n💬 Sending to all users: '{question}'")
     print("-" * 60)
     
-    for name, session_id in sessions.items():
+    # Sessions are independent, so all requests go out at once
+    responses = run_concurrently(manager, [
+        manager.asend_message(session_id, question)
+        for session_id in sessions.values()
+    ])
+    
+    for name, response in zip(sessions, responses):
         print(f"\n👤 {name}:")
-        response = manager.send_message(session_id, question)
         print(f"🤖 {response}")
-        time.sleep(0.5)  # Small delay between requests
 
 
-def example_3_session_management():
+def example_3_session_management(manager: SessionManager):
     """Example 3: Session management operations"""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 3: Session Management")
     print("=" * 60)
     
-    manager = SessionManager()
-    
     # Create a few test sessions
     print("\n📝 Creating test sessions...")
     test_users = ["Alice", "Bob", "Carol"]
-    created_sessions = []
-    
-    for name in test_users:
-        session_id = manager.create_session(
+    created_sessions = run_concurrently(manager, [
+        manager.acreate_session(
             agent_id="dynamic_session_agent",
             user_name=name,
             user_preferences=f"Test user {name}"
         )
-        created_sessions.append(session_id)
+        for name in test_users
+    ])
+    
+    for name in test_users:
         print(f"✅ Created session for {name}")
     
     # List all sessions
@@ -144,14 +181,12 @@ def example_3_session_management():
             print(f"❌ Failed to delete: {e}")
 
 
-def example_4_error_handling():
+def example_4_error_handling(manager: SessionManager):
     """Example 4: Error handling"""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 4: Error Handling")
     print("=" * 60)
     
-    manager = SessionManager()
-    
     # Test with invalid session ID
     print("\n🧪 Testing with invalid session ID...")
     try:
@@ -180,14 +215,12 @@ def example_4_error_handling():
         print(f"✅ Caught expected error: {e}")
 
 
-def example_5_state_persistence():
+def example_5_state_persistence(manager: SessionManager):
     """Example 5: State persistence across messages"""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 5: State Persistence")
     print("=" * 60)
     
-    manager = SessionManager()
-    
     # Create session
     print("\n📝 Creating session...")
     session_id = manager.create_session(
@@ -209,7 +242,7 @@ def example_5_state_persistence():
         print(f"\n{i}. 👤 User: {msg}")
         response = manager.send_message(session_id, msg)
         print(f"   🤖 Agent: {response}")
-        time.sleep(0.5)
+        pause(0.5)
 
 
 def main():
@@ -222,38 +255,40 @@ def main():
     print("\nPress Enter to continue...")
     input()
     
-    try:
-        # Run examples
-        example_1_simple_chat()
-        
-        time.sleep(2)
-        example_2_multiple_users()
-        
-        time.sleep(2)
-        example_3_session_management()
-        
-        time.sleep(2)
-        example_4_error_handling()
-        
-        time.sleep(2)
-        example_5_state_persistence()
-        
-        print("\n\n" + "=" * 60)
-        print("✅ All examples completed!")
-        print("=" * 60)
-        print("\n💡 Tips:")
-        print("  - Use manager.create_session() to create unique sessions")
-        print("  - Each session maintains its own state and context")
-        print("  - Sessions are isolated - no data leakage")
-        print("  - Use manager.get_chat_url() to chat in browser")
-        
-    except ConnectionError:
-        print("\n❌ Cannot connect to ADK Web!")
-        print("\nPlease start ADK Web:")
-        print("  cd d:\\agentic\\adk\\5.5-advanced-sessions")
-        print("  adk web")
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
+    # One manager (and one HTTP connection pool) shared by every example
+    with SessionManager() as manager:
+        try:
+            # Run examples
+            example_1_simple_chat(manager)
+            
+            pause(2)
+            example_2_multiple_users(manager)
+            
+            pause(2)
+            example_3_session_management(manager)
+            
+            pause(2)
+            example_4_error_handling(manager)
+            
+            pause(2)
+            example_5_state_persistence(manager)
+            
+            print("\n\n" + "=" * 60)
+            print("✅ All examples completed!")
+            print("=" * 60)
+            print("\n💡 Tips:")
+            print("  - Use manager.create_session() to create unique sessions")
+            print("  - Each session maintains its own state and context")
+            print("  - Sessions are isolated - no data leakage")
+            print("  - Use manager.get_chat_url() to chat in browser")
+            
+        except ConnectionError:
+            print("\n❌ Cannot connect to ADK Web!")
+            print("\nPlease start ADK Web:")
+            print("  cd d:\\agentic\\adk\\5.5-advanced-sessions")
+            print("  adk web")
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
 
 
 if __name__ == "__main__":
@@ -4,9 +4,45 @@
 A clean Python interface for managing ADK sessions programmatically.
 """
 
+import asyncio
+import importlib.util
+import time
 import requests
-from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from urllib.parse import urlencode
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+# Optional: orjson (C extension) encodes/decodes JSON several times faster
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
+# Optional: httpx gives the async methods a native async client, multiplexed
+# over HTTP/2 when the "h2" package is installed (pip install "httpx[http2]").
+# Without it, the async methods run the sync calls in worker threads.
+try:
+    import httpx
+    HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+# Optional: ijson lets iter_sessions parse the session list as it streams in
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 class SessionManager:
@@ -15,31 +51,226 @@ class SessionManager:
     
     Features:
     - Create sessions with custom state
-    - Send messages to sessions
+    - Send messages to sessions (or stream the reply with stream_message)
+    - Async variants for concurrent fan-out (acreate_session, asend_message)
+    - Batched messaging across sessions (send_messages)
     - List and manage sessions
+    - Short-lived cache for session reads (list_sessions, get_session)
     - Clean error handling
     
     Example:
-        >>> manager = SessionManager()
-        >>> session_id = manager.create_session(
-        ...     agent_id="dynamic_session_agent",
-        ...     user_name="Alice",
-        ...     user_email="alice@email.com"
-        ... )
-        >>> response = manager.send_message(session_id, "Hello!")
-        >>> print(response)
+        >>> with SessionManager() as manager:
+        ...     session_id = manager.create_session(
+        ...         agent_id="dynamic_session_agent",
+        ...         user_name="Alice",
+        ...         user_email="alice@email.com"
+        ...     )
+        ...     response = manager.send_message(session_id, "Hello!")
+        ...     print(response)
     """
     
-    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: int = 30,
+        cache_ttl: float = 5.0
+    ):
         """
         Initialize SessionManager.
         
         Args:
             base_url: ADK Web server URL (default: http://localhost:8000)
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Seconds to reuse session read results when the server sends
+                no Cache-Control max-age, 0 disables (default: 5.0)
         """
         self.base_url = base_url.rstrip('/')
+        self._sessions_url = f"{self.base_url}/sessions"
+        self._chat_url = f"{self.base_url}/chat"
         self.timeout = timeout
+        # (connect, read): a slow connect or TLS handshake gives up early
+        self._timeouts = (min(5, timeout), timeout)
+        self.cache_ttl = cache_ttl
+        
+        # Cached GET results: url -> (expires at, data)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # False once GET /sessions is seen to ignore ?agent_id= (None = unknown)
+        self._server_supports_filter: Optional[bool] = None
+        
+        # Async client, created on first use inside an event loop
+        self._aclient = None
+        self._aclient_loop = None
+        
+        # One pooled HTTP session for every call, so connections are reused.
+        # Transient gateway errors are retried (idempotent methods only);
+        # read timeouts are not, so they still surface as TimeoutError.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                read=False,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        })
+    
+    def _cache_get(self, url: str) -> Optional[Any]:
+        """Return a cached GET result if it is still fresh"""
+        entry = self._cache.get(url)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+    
+    def _cache_put(self, url: str, data: Any, response: requests.Response):
+        """Store a GET result, honoring the response's Cache-Control header"""
+        ttl = self.cache_ttl
+        for directive in response.headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            name = name.lower()
+            if name in ("no-store", "no-cache"):
+                ttl = 0
+                break
+            if name == "max-age" and value.isdigit():
+                ttl = int(value)
+        
+        if ttl > 0:
+            self._cache[url] = (time.monotonic() + ttl, data)
+    
+    def _invalidate(self, session_id: Optional[str] = None):
+        """Drop the cached session list (and one session's details, if given)"""
+        self._cache.pop(self._sessions_url, None)
+        filtered = f"{self._sessions_url}?"
+        for url in [url for url in self._cache if url.startswith(filtered)]:
+            del self._cache[url]
+        if session_id:
+            self._cache.pop(f"{self._sessions_url}/{session_id}", None)
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _request(
+        self,
+        method: str,
+        url: str,
+        action: str,
+        session_id: Optional[str] = None,
+        cache: bool = False,
+        expect_json: bool = True,
+        **kwargs
+    ) -> Any:
+        """
+        Send a request on the pooled session and decode the JSON response
+        (or return the response itself with expect_json=False).
+        
+        Failures are mapped to ConnectionError, TimeoutError or ValueError
+        (404 on a session URL becomes "Session not found"). With cache=True
+        a fresh cached result for the URL is returned without a request.
+        """
+        if cache:
+            cached = self._cache_get(url)
+            if cached is not None:
+                return cached
+        
+        try:
+            response = self._session.request(method, url, timeout=self._timeouts, **kwargs)
+        except requests.exceptions.ConnectionError:
+            raise ConnectionError(
+                f"Cannot connect to ADK Web at {self.base_url}. "
+                "Make sure 'adk web' is running."
+            )
+        except requests.exceptions.Timeout:
+            raise TimeoutError(f"Request timed out after {self.timeout} seconds")
+        except Exception as e:
+            raise ValueError(f"Unexpected error: {str(e)}")
+        
+        if response.status_code >= 400:
+            error = self._status_error(response.status_code, response.text, action, session_id)
+            response.close()  # hands a streamed response's connection back to the pool
+            raise error
+        
+        try:
+            data = _loads(response.content) if expect_json else response
+        except Exception as e:
+            raise ValueError(f"Unexpected error: {str(e)}")
+        
+        if cache:
+            self._cache_put(url, data, response)
+        return data
+    
+    @contextmanager
+    def _reading_stream(self, response: requests.Response) -> Iterator[None]:
+        """
+        Close a streamed response when done and map errors raised while its
+        body is read to ConnectionError / TimeoutError, like _request does.
+        """
+        with response:
+            try:
+                yield
+            except (ReadTimeoutError, requests.exceptions.Timeout):
+                raise TimeoutError(f"Request timed out after {self.timeout} seconds")
+            except requests.exceptions.ConnectionError as e:
+                # iter_content wraps a read timeout in requests' ConnectionError
+                if e.args and isinstance(e.args[0], ReadTimeoutError):
+                    raise TimeoutError(f"Request timed out after {self.timeout} seconds")
+                raise ConnectionError(f"Connection to ADK Web at {self.base_url} was lost")
+            except (requests.exceptions.ChunkedEncodingError, ProtocolError):
+                raise ConnectionError(f"Connection to ADK Web at {self.base_url} was lost")
+    
+    def _status_error(
+        self,
+        status: int,
+        text: str,
+        action: str,
+        session_id: Optional[str] = None
+    ) -> Exception:
+        """Exception for an HTTP error status, checked directly (no raise_for_status)"""
+        if status == 404 and session_id:
+            return ValueError(f"Session not found: {session_id}")
+        if status in (408, 504):
+            return TimeoutError(f"Failed to {action}: server timed out ({status})")
+        return ValueError(f"Failed to {action}: {status} - {text}")
+    
+    @staticmethod
+    def _reply_text(data: Dict[str, Any]) -> str:
+        """Agent reply from a /chat response ("response", falling back to "text")"""
+        reply = data.get("response")
+        return reply if reply is not None else data.get("text", "")
+    
+    @staticmethod
+    def _build_state(
+        user_name: str,
+        user_email: Optional[str] = None,
+        user_preferences: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the session state dict (only non-empty fields)"""
+        state = {"user_name": user_name}
+        
+        if user_email:
+            state["user_email"] = user_email
+        if user_preferences:
+            state["user_preferences"] = user_preferences
+        
+        # Add any additional state variables
+        state.update(kwargs)
+        return state
     
     def create_session(
         self,
@@ -75,42 +306,21 @@ class SessionManager:
             ...     custom_field="custom value"
             ... )
         """
-        # Build state dict
-        state = {"user_name": user_name}
-        
-        if user_email:
-            state["user_email"] = user_email
-        if user_preferences:
-            state["user_preferences"] = user_preferences
-        
-        # Add any additional state variables
-        state.update(kwargs)
+        state = self._build_state(user_name, user_email, user_preferences, **kwargs)
         
-        # Make request
-        url = urljoin(self.base_url, "/sessions")
         payload = {
             "agent_id": agent_id,
             "state": state
         }
         
-        try:
-            response = requests.post(url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data["session_id"]
-        
-        except requests.exceptions.ConnectionError:
-            raise ConnectionError(
-                f"Cannot connect to ADK Web at {self.base_url}. "
-                "Make sure 'adk web' is running."
-            )
-        except requests.exceptions.Timeout:
-            raise TimeoutError(f"Request timed out after {self.timeout} seconds")
-        except requests.exceptions.HTTPError as e:
-            raise ValueError(f"Failed to create session: {e.response.status_code} - {e.response.text}")
-        except Exception as e:
-            raise ValueError(f"Unexpected error: {str(e)}")
+        data = self._request(
+            "POST",
+            self._sessions_url,
+            action="create session",
+            data=_dumps(payload)
+        )
+        self._invalidate()
+        return data["session_id"]
     
     def send_message(self, session_id: str, message: str) -> str:
         """
@@ -132,72 +342,298 @@ class SessionManager:
             >>> print(response)
             "Your name is Alice Johnson!"
         """
-        url = urljoin(self.base_url, "/chat")
         payload = {
             "session_id": session_id,
             "message": message
         }
         
-        try:
-            response = requests.post(url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data.get("response", data.get("text", ""))
+        data = self._request(
+            "POST",
+            self._chat_url,
+            action="send message",
+            session_id=session_id,
+            data=_dumps(payload)
+        )
+        # The conversation changed this session's state
+        self._cache.pop(f"{self._sessions_url}/{session_id}", None)
+        return self._reply_text(data)
+    
+    def stream_message(self, session_id: str, message: str) -> Iterator[str]:
+        """
+        Send a message and yield the agent's reply as it is generated.
         
-        except requests.exceptions.ConnectionError:
+        Asks the server for Server-Sent Events; each "data:" event's "delta" is
+        yielded as it arrives. If the server answers with plain JSON instead,
+        the whole reply is yielded once.
+        
+        Args:
+            session_id: Session UUID
+            message: User message to send
+        
+        Example:
+            >>> for chunk in manager.stream_message(session_id, "Tell me a story"):
+            ...     print(chunk, end="", flush=True)
+        """
+        payload = {
+            "session_id": session_id,
+            "message": message
+        }
+        
+        response = self._request(
+            "POST",
+            self._chat_url,
+            action="send message",
+            session_id=session_id,
+            expect_json=False,
+            data=_dumps(payload),
+            headers={"Accept": "text/event-stream"},
+            stream=True
+        )
+        self._cache.pop(f"{self._sessions_url}/{session_id}", None)
+        
+        with self._reading_stream(response):
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                yield self._reply_text(_loads(response.content))
+                return
+            
+            # SSE is always UTF-8; requests would guess ISO-8859-1 when the
+            # Content-Type has no charset, so decode each line ourselves
+            for raw_line in response.iter_lines():
+                line = raw_line.decode("utf-8")
+                if not line or not line.startswith("data:"):
+                    continue
+                event = line[5:].strip()
+                if event == "[DONE]":
+                    break
+                chunk = _loads(event)
+                delta = chunk.get("delta")
+                yield delta if delta is not None else self._reply_text(chunk)
+    
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """httpx client for the running event loop (one per loop)"""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                headers={"Content-Type": "application/json", "Accept": "application/json"},
+                # Same split as the sync path: a dead host fails within 5s
+                timeout=httpx.Timeout(self.timeout, connect=min(5, self.timeout))
+            )
+            self._aclient_loop = loop
+        return self._aclient
+    
+    async def _apost(self, path: str, payload: Dict[str, Any], action: str,
+                     session_id: Optional[str] = None) -> Dict[str, Any]:
+        """POST JSON with the async client, mapping errors like the sync methods"""
+        try:
+            response = await self._get_async_client().post(path, content=_dumps(payload))
+        except httpx.ConnectError:
             raise ConnectionError(
                 f"Cannot connect to ADK Web at {self.base_url}. "
                 "Make sure 'adk web' is running."
             )
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             raise TimeoutError(f"Request timed out after {self.timeout} seconds")
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                raise ValueError(f"Session not found: {session_id}")
-            raise ValueError(f"Failed to send message: {e.response.status_code} - {e.response.text}")
         except Exception as e:
             raise ValueError(f"Unexpected error: {str(e)}")
+        
+        if response.status_code >= 400:
+            raise self._status_error(response.status_code, response.text, action, session_id)
+        
+        try:
+            return _loads(response.content)
+        except Exception as e:
+            raise ValueError(f"Unexpected error: {str(e)}")
+    
+    async def acreate_session(
+        self,
+        agent_id: str,
+        user_name: str,
+        user_email: Optional[str] = None,
+        user_preferences: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Async version of create_session, for creating many sessions concurrently.
+        
+        Example:
+            >>> session_ids = await asyncio.gather(
+            ...     manager.acreate_session(agent_id="dynamic_session_agent", user_name="Alice"),
+            ...     manager.acreate_session(agent_id="dynamic_session_agent", user_name="Bob"),
+            ... )
+        """
+        if httpx is None:
+            return await asyncio.to_thread(
+                self.create_session,
+                agent_id,
+                user_name,
+                user_email,
+                user_preferences,
+                **kwargs
+            )
+        
+        state = self._build_state(user_name, user_email, user_preferences, **kwargs)
+        data = await self._apost(
+            "/sessions",
+            {"agent_id": agent_id, "state": state},
+            action="create session"
+        )
+        self._invalidate()
+        return data["session_id"]
+    
+    async def asend_message(self, session_id: str, message: str) -> str:
+        """
+        Async version of send_message, for messaging many sessions concurrently.
+        
+        Example:
+            >>> responses = await asyncio.gather(
+            ...     *[manager.asend_message(sid, "Hello!") for sid in session_ids]
+            ... )
+        """
+        if httpx is None:
+            return await asyncio.to_thread(self.send_message, session_id, message)
+        
+        data = await self._apost(
+            "/chat",
+            {"session_id": session_id, "message": message},
+            action="send message",
+            session_id=session_id
+        )
+        self._cache.pop(f"{self._sessions_url}/{session_id}", None)
+        return self._reply_text(data)
+    
+    async def asend_messages(self, messages: List[Tuple[str, str]]) -> List[str]:
+        """
+        Send many (session_id, message) pairs concurrently.
+        
+        Messages for the same session are sent in order, since each turn builds
+        on the previous one; different sessions run in parallel.
+        
+        Args:
+            messages: List of (session_id, message) pairs
+        
+        Returns:
+            List[str]: Agent responses, in the same order as messages
+        """
+        responses: List[Optional[str]] = [None] * len(messages)
+        
+        # Group message positions by session
+        by_session: Dict[str, List[int]] = {}
+        for i, (session_id, _) in enumerate(messages):
+            by_session.setdefault(session_id, []).append(i)
+        
+        async def run_conversation(positions: List[int]):
+            for i in positions:
+                session_id, message = messages[i]
+                responses[i] = await self.asend_message(session_id, message)
+        
+        await asyncio.gather(*(run_conversation(p) for p in by_session.values()))
+        return responses
+    
+    def send_messages(self, messages: List[Tuple[str, str]]) -> List[str]:
+        """
+        Send many (session_id, message) pairs concurrently (blocking wrapper).
+        
+        Must not be called from inside a running event loop; use
+        asend_messages there instead.
+        
+        Example:
+            >>> responses = manager.send_messages([
+            ...     (alice_session, "What's my name?"),
+            ...     (bob_session, "What's my name?"),
+            ... ])
+        """
+        async def run():
+            try:
+                return await self.asend_messages(messages)
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    async def aclose(self):
+        """Close the async client (call before its event loop ends)"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_loop = None
     
     def list_sessions(self, agent_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all active sessions.
         
         Args:
-            agent_id: Optional filter by agent (not currently supported by ADK Web)
+            agent_id: Optional filter by agent. Sent to the server as ?agent_id=
+                and also applied here, in case the server ignores it.
         
         Returns:
-            List[Dict]: List of session objects with metadata and state
+            List[Dict]: List of session objects with metadata and state. The list
+                is a fresh copy; the session dicts in it are shared with the cache.
         
         Example:
             >>> sessions = manager.list_sessions()
             >>> for session in sessions:
             ...     print(f"{session['session_id']}: {session['state']['user_name']}")
         """
-        url = urljoin(self.base_url, "/sessions")
+        url = self._sessions_url
+        if agent_id and self._server_supports_filter is not False:
+            url = f"{url}?{urlencode({'agent_id': agent_id})}"
         
-        try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            sessions = data.get("sessions", [])
-            
-            # Filter by agent_id if specified
-            if agent_id:
-                sessions = [s for s in sessions if s.get("agent_id") == agent_id]
-            
-            return sessions
+        data = self._request("GET", url, action="list sessions", cache=True)
+        sessions = data.get("sessions", [])
         
-        except requests.exceptions.ConnectionError:
-            raise ConnectionError(
-                f"Cannot connect to ADK Web at {self.base_url}. "
-                "Make sure 'adk web' is running."
-            )
-        except requests.exceptions.Timeout:
-            raise TimeoutError(f"Request timed out after {self.timeout} seconds")
-        except Exception as e:
-            raise ValueError(f"Unexpected error: {str(e)}")
+        if not agent_id:
+            return list(sessions)  # copy: the cached list itself must stay intact
+        
+        # Always filter here: a reply where every session matches can't tell
+        # a filtering server from one that ignored the query. A reply with a
+        # mismatch can, so stop sending the parameter after one.
+        matching = [s for s in sessions if s.get("agent_id") == agent_id]
+        if len(matching) != len(sessions):
+            self._server_supports_filter = False
+        
+        return matching
+    
+    def iter_sessions(self, agent_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield active sessions one at a time.
+        
+        With ijson installed the response is parsed as it streams in, so large
+        session lists are never held in memory at once. Without it this falls
+        back to list_sessions.
+        
+        Args:
+            agent_id: Optional filter by agent
+        
+        Example:
+            >>> for session in manager.iter_sessions("dynamic_session_agent"):
+            ...     print(session['session_id'])
+        """
+        if ijson is None:
+            yield from self.list_sessions(agent_id)
+            return
+        
+        url = self._sessions_url
+        if agent_id and self._server_supports_filter is not False:
+            url = f"{url}?{urlencode({'agent_id': agent_id})}"
+        
+        response = self._request(
+            "GET",
+            url,
+            action="list sessions",
+            expect_json=False,
+            stream=True
+        )
+        with self._reading_stream(response):
+            response.raw.decode_content = True
+            try:
+                for session in ijson.items(response.raw, "sessions.item", use_float=True):
+                    if not agent_id or session.get("agent_id") == agent_id:
+                        yield session
+            except ijson.JSONError as e:
+                raise ValueError(f"Unexpected error: {str(e)}")
     
     def get_session(self, session_id: str) -> Dict[str, Any]:
         """
@@ -207,32 +643,21 @@ class SessionManager:
             session_id: Session UUID
         
         Returns:
-            Dict: Session object with metadata and state
+            Dict: Session object with metadata and state. The dict is a fresh
+                (shallow) copy; nested values are shared with the cache.
         
         Example:
             >>> details = manager.get_session(session_id)
             >>> print(details['state']['user_name'])
             "Alice Johnson"
         """
-        url = urljoin(self.base_url, f"/sessions/{session_id}")
-        
-        try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            return response.json()
-        
-        except requests.exceptions.ConnectionError:
-            raise ConnectionError(
-                f"Cannot connect to ADK Web at {self.base_url}. "
-                "Make sure 'adk web' is running."
-            )
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                raise ValueError(f"Session not found: {session_id}")
-            raise ValueError(f"Failed to get session: {e.response.status_code} - {e.response.text}")
-        except Exception as e:
-            raise ValueError(f"Unexpected error: {str(e)}")
+        return dict(self._request(
+            "GET",
+            f"{self._sessions_url}/{session_id}",
+            action="get session",
+            session_id=session_id,
+            cache=True
+        ))
     
     def delete_session(self, session_id: str) -> bool:
         """
@@ -248,24 +673,15 @@ class SessionManager:
             >>> manager.delete_session(session_id)
             True
         """
-        url = urljoin(self.base_url, f"/sessions/{session_id}")
-        
-        try:
-            response = requests.delete(url, timeout=self.timeout)
-            response.raise_for_status()
-            return True
-        
-        except requests.exceptions.ConnectionError:
-            raise ConnectionError(
-                f"Cannot connect to ADK Web at {self.base_url}. "
-                "Make sure 'adk web' is running."
-            )
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                raise ValueError(f"Session not found: {session_id}")
-            raise ValueError(f"Failed to delete session: {e.response.status_code} - {e.response.text}")
-        except Exception as e:
-            raise ValueError(f"Unexpected error: {str(e)}")
+        self._request(
+            "DELETE",
+            f"{self._sessions_url}/{session_id}",
+            action="delete session",
+            session_id=session_id,
+            expect_json=False
+        )
+        self._invalidate(session_id)
+        return True
     
     def get_chat_url(self, session_id: str) -> str:
         """
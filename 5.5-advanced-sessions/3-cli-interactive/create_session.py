@@ -4,14 +4,31 @@
 Create ADK sessions from your terminal with beautiful interactive prompts.
 """
 
-import requests
+import atexit
 import sys
-from typing import Optional, Dict, List
+from typing import Optional, Dict
+
+# Optional: orjson (C extension) encodes/decodes JSON several times faster
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
 
 # Configuration
 ADK_BASE_URL = "http://localhost:8000"
 AGENT_ID = "dynamic_session_agent"
 
+# One HTTP session for the whole CLI run, so repeated creates reuse the connection.
+# Created on first use: importing requests is slow and the CLI prompts first.
+_SESSION = None
+
 # ANSI color codes
 class Colors:
     HEADER = '\033[95m'
@@ -24,8 +41,17 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
-# Session history
-session_history: List[Dict] = []
+# Pre-built color prefixes for the message helpers
+_HEADER_PREFIX = f"\n{Colors.HEADER}{Colors.BOLD}"
+_SUCCESS_PREFIX = f"{Colors.GREEN}✅ "
+_ERROR_PREFIX = f"{Colors.RED}❌ "
+_INFO_PREFIX = f"{Colors.CYAN}ℹ️  "
+_PROMPT_PREFIX = Colors.BLUE
+_PROMPT_SUFFIX = f": {Colors.ENDC}"
+_RULE = "=" * 50
+
+# Session history: session_id -> details, in creation order
+session_history: Dict[str, Dict] = {}
 
 
 def colored(text: str, color: str) -> str:
@@ -35,30 +61,31 @@ def colored(text: str, color: str) -> str:
 
 def print_header(text: str):
     """Print a colored header"""
-    print(f"\n{colored(text, Colors.HEADER + Colors.BOLD)}")
-    print("=" * 50)
+    print(_HEADER_PREFIX, text, Colors.ENDC, sep="")
+    print(_RULE)
 
 
 def print_success(text: str):
     """Print success message"""
-    print(colored(f"✅ {text}", Colors.GREEN))
+    print(_SUCCESS_PREFIX, text, Colors.ENDC, sep="")
 
 
 def print_error(text: str):
     """Print error message"""
-    print(colored(f"❌ {text}", Colors.RED))
+    print(_ERROR_PREFIX, text, Colors.ENDC, sep="")
 
 
 def print_info(text: str):
     """Print info message"""
-    print(colored(f"ℹ️  {text}", Colors.CYAN))
+    print(_INFO_PREFIX, text, Colors.ENDC, sep="")
 
 
 def get_input(prompt: str, required: bool = True) -> Optional[str]:
     """Get user input with colored prompt"""
+    prompt = f"{_PROMPT_PREFIX}{prompt}{_PROMPT_SUFFIX}"
     try:
         while True:
-            value = input(colored(f"{prompt}: ", Colors.BLUE)).strip()
+            value = input(prompt).strip()
             
             if value:
                 return value
@@ -71,6 +98,17 @@ def get_input(prompt: str, required: bool = True) -> Optional[str]:
         sys.exit(0)
 
 
+def get_http_session():
+    """Shared requests.Session, created (and requests imported) on first call"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        _SESSION.headers["Content-Type"] = "application/json"
+        atexit.register(_SESSION.close)
+    return _SESSION
+
+
 def create_session(
     user_id: str,
     user_name: str,
@@ -79,6 +117,7 @@ def create_session(
     conversation_context: Optional[str] = None
 ) -> Optional[str]:
     """Create a session via ADK Web API"""
+    import requests
     
     # Build state
     state = {"user_name": user_name}
@@ -93,26 +132,26 @@ def create_session(
     try:
         print(colored("\n⏳ Creating session...", Colors.YELLOW))
         
-        response = requests.post(
+        response = get_http_session().post(
             f"{ADK_BASE_URL}/sessions",
-            json={
+            data=_dumps({
                 "agent_id": AGENT_ID,
                 "state": state
-            },
+            }),
             timeout=10
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             session_id = data["session_id"]
             
             # Store in history
-            session_history.append({
+            session_history[session_id] = {
                 "session_id": session_id,
                 "user_id": user_id,
                 "user_name": user_name,
                 "state": state
-            })
+            }
             
             return session_id
         else:
@@ -131,6 +170,11 @@ def create_session(
         return None
 
 
+def get_session_by_id(session_id: str) -> Optional[Dict]:
+    """Look up a session created in this run"""
+    return session_history.get(session_id)
+
+
 def display_session_info(session_id: str, user_id: str, user_name: str, state: Dict):
     """Display session information beautifully"""
     print_success("Session created successfully!")
@@ -157,7 +201,7 @@ def display_session_history():
     
     print_header(f"📊 Session History ({len(session_history)} sessions)")
     
-    for i, session in enumerate(session_history, 1):
+    for i, session in enumerate(session_history.values(), 1):
         print(f"\n{colored(f'{i}. {session['user_name']} ({session['user_id']})', Colors.BOLD)}")
         print(f"   Session: {session['session_id'][:16]}...")
         chat_url = f"{ADK_BASE_URL}/?session={session['session_id']}"
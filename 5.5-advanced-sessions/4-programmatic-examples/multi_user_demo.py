@@ -5,9 +5,26 @@ Demonstrates multiple users chatting with the agent simultaneously,
 each with their own isolated session and state.
 """
 
+import asyncio
 import requests
+import socket
 import time
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
+from urllib3.util.retry import Retry
+
+# Optional: orjson (C extension) encodes/decodes JSON several times faster
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
 
 
 # Configuration
@@ -15,11 +32,56 @@ ADK_BASE_URL = "http://localhost:8000"
 AGENT_ID = "dynamic_session_agent"
 
 
+class _NoDelayAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections disable Nagle and enable TCP keep-alive"""
+    
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", self.SOCKET_OPTIONS)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+
 class SessionClient:
-    """Simple synchronous session client"""
+    """Simple synchronous session client (pooled; use as a context manager)"""
     
     def __init__(self, base_url: str = ADK_BASE_URL):
         self.base_url = base_url.rstrip('/')
+        self._sessions_url = f"{self.base_url}/sessions"
+        self._chat_url = f"{self.base_url}/chat"
+        # One pooled session for every call, so connections are reused.
+        # Small JSON POSTs: send each immediately instead of waiting on Nagle.
+        self.session = requests.Session()
+        # pool_block makes callers wait for a free connection rather than
+        # opening extra ones. Only failed connects are retried (without
+        # sleeping): every call here is a POST, which urllib3 never retries
+        # on a gateway status.
+        adapter = _NoDelayAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            pool_block=True,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Bodies are pre-encoded bytes (data=), so declare the type once
+        self.session.headers["Content-Type"] = "application/json"
+    
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def create_session(self, user_name: str, user_email: str = None, 
                       user_preferences: str = None) -> Optional[str]:
@@ -31,13 +93,13 @@ class SessionClient:
             state["user_preferences"] = user_preferences
         
         try:
-            response = requests.post(
-                f"{self.base_url}/sessions",
-                json={"agent_id": AGENT_ID, "state": state},
+            response = self.session.post(
+                self._sessions_url,
+                data=_dumps({"agent_id": AGENT_ID, "state": state}),
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()["session_id"]
+            return _loads(response.content)["session_id"]
         except Exception as e:
             print(f"❌ Error creating session: {e}")
             return None
@@ -45,13 +107,13 @@ class SessionClient:
     def send_message(self, session_id: str, message: str) -> Optional[str]:
         """Send message to session"""
         try:
-            response = requests.post(
-                f"{self.base_url}/chat",
-                json={"session_id": session_id, "message": message},
+            response = self.session.post(
+                self._chat_url,
+                data=_dumps({"session_id": session_id, "message": message}),
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             return data.get("response", data.get("text", ""))
         except Exception as e:
             print(f"❌ Error sending message: {e}")
@@ -74,12 +136,20 @@ def print_conversation(user_name: str, message: str, response: str):
     print(f"Agent: {response}")
 
 
-def demo_1_basic_multi_user():
+async def user_conversation(client: SessionClient, user_name: str,
+                            session_id: str, messages: List[str]):
+    """Send one user's messages in order, printing each exchange as it completes"""
+    for message in messages:
+        # The blocking request runs in a worker thread, so other users proceed
+        response = await asyncio.to_thread(client.send_message, session_id, message)
+        if response:
+            print_conversation(user_name, message, response)
+
+
+async def demo_1_basic_multi_user(client: SessionClient):
     """Demo 1: Basic multi-user conversations"""
     print_header("DEMO 1: Basic Multi-User Conversations")
     
-    client = SessionClient()
-    
     # Define users with different contexts
     users = [
         {
@@ -134,29 +204,20 @@ def demo_1_basic_multi_user():
     
     print(f"\n✅ Successfully created {len(sessions)} sessions!")
     
-    # Have conversations
+    # Have conversations: users concurrently, each user's messages in order
     print("\n💬 Starting conversations...")
     
-    for user in users:
-        user_name = user["name"]
-        session_id = sessions.get(user_name)
-        
-        if not session_id:
-            continue
-        
-        for message in user["messages"]:
-            response = client.send_message(session_id, message)
-            if response:
-                print_conversation(user_name, message, response)
-            time.sleep(0.5)  # Small delay between messages
+    await asyncio.gather(*(
+        user_conversation(client, user["name"], sessions[user["name"]], user["messages"])
+        for user in users
+        if user["name"] in sessions
+    ))
 
 
-def demo_2_state_isolation():
+def demo_2_state_isolation(client: SessionClient):
     """Demo 2: Prove state isolation between sessions"""
     print_header("DEMO 2: State Isolation Test")
     
-    client = SessionClient()
-    
     print("\n🧪 Testing state isolation...")
     
     # Create two sessions with different contexts
@@ -184,22 +245,16 @@ def demo_2_state_isolation():
     alice_response1 = client.send_message(alice_session, alice_msg1)
     print_conversation("Alice", alice_msg1, alice_response1)
     
-    time.sleep(0.5)
-    
     # Bob talks about his interest
     bob_msg1 = "I really enjoy drinking coffee while analyzing data."
     bob_response1 = client.send_message(bob_session, bob_msg1)
     print_conversation("Bob", bob_msg1, bob_response1)
     
-    time.sleep(0.5)
-    
     # Alice asks about her interests (should NOT mention coffee or Bob)
     alice_msg2 = "What are my interests?"
     alice_response2 = client.send_message(alice_session, alice_msg2)
     print_conversation("Alice", alice_msg2, alice_response2)
     
-    time.sleep(0.5)
-    
     # Bob asks about his interests (should NOT mention Python or Alice)
     bob_msg2 = "What do I enjoy doing?"
     bob_response2 = client.send_message(bob_session, bob_msg2)
@@ -225,12 +280,10 @@ def demo_2_state_isolation():
             print("   Bob's response mentioned Alice's context")
 
 
-def demo_3_conversation_memory():
+def demo_3_conversation_memory(client: SessionClient):
     """Demo 3: Test conversation memory within a session"""
     print_header("DEMO 3: Conversation Memory Test")
     
-    client = SessionClient()
-    
     print("\n🧠 Testing conversation memory...")
     
     # Create session
@@ -259,7 +312,6 @@ def demo_3_conversation_memory():
         print(f"\n{i}. {purpose}")
         response = client.send_message(session_id, message)
         print_conversation("User", message, response)
-        time.sleep(0.5)
     
     print("\n" + "=" * 60)
     print("✅ Conversation memory test completed!")
@@ -281,14 +333,15 @@ def main():
     input()
     
     try:
-        # Run demos
-        demo_1_basic_multi_user()
-        
-        time.sleep(2)
-        demo_2_state_isolation()
-        
-        time.sleep(2)
-        demo_3_conversation_memory()
+        # Run demos on one client, so connections carry over between them
+        with SessionClient() as client:
+            asyncio.run(demo_1_basic_multi_user(client))
+            
+            time.sleep(2)
+            demo_2_state_isolation(client)
+            
+            time.sleep(2)
+            demo_3_conversation_memory(client)
         
         # Summary
         print_header("✅ All Demos Completed!")
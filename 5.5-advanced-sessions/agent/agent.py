@@ -3,35 +3,20 @@ Dynamic Session Agent - Handles Empty State Gracefully
 
 This agent demonstrates proper dynamic state management:
 ✅ No hardcoded initial_state
-✅ Uses Jinja2 conditionals to handle missing variables
+✅ Builds its instruction from whatever state is set
 ✅ Asks users for information when state is empty
 ✅ State is populated dynamically per session
 """
 
-from google.adk import Agent
-
-# Dynamic instruction that handles empty state gracefully
-instruction = """
-You are a helpful and personalized assistant.
-
-{%- if user_name %}
-Current User: {{user_name}}
-{%- else %}
-Note: I don't know who I'm talking to yet.
-{%- endif %}
-
-{%- if user_email %}
-Email: {{user_email}}
-{%- endif %}
+from typing import Any, Mapping
 
-{%- if user_preferences %}
-User Information: {{user_preferences}}
-{%- endif %}
+from google.adk import Agent
+from google.adk.agents.readonly_context import ReadonlyContext
 
-{%- if conversation_context %}
-Context: {{conversation_context}}
-{%- endif %}
+# Static parts of the instruction (the same for every user)
+_INTRO = "\nYou are a helpful and personalized assistant."
 
+_GUIDELINES = """
 BEHAVIOR:
 - If you don't know the user's name, politely introduce yourself and ask for their name
 - If you don't know their preferences, ask what they're interested in
@@ -45,11 +30,43 @@ IMPORTANT:
 - Reference previous conversation points when relevant
 """
 
+_UNKNOWN_USER = "Note: I don't know who I'm talking to yet."
+
+# Optional state variables and the label each is shown with
+_STATE_LINES = (
+    ("user_email", "Email"),
+    ("user_preferences", "User Information"),
+    ("conversation_context", "Context"),
+)
+
+# Instruction for a session with no state yet (the first turn, usually)
+_EMPTY_STATE_INSTRUCTION = f"{_INTRO}\n{_UNKNOWN_USER}\n{_GUIDELINES}"
+
+
+def describe_user(state: Mapping[str, Any]) -> str:
+    """Lines describing the user, for whichever state variables are set"""
+    user_name = state.get("user_name")
+    lines = [f"Current User: {user_name}" if user_name else _UNKNOWN_USER]
+    for key, label in _STATE_LINES:
+        value = state.get(key)
+        if value:
+            lines.append(f"{label}: {value}")
+    return "\n".join(lines)
+
+
+def build_instruction(context: ReadonlyContext) -> str:
+    """Dynamic instruction that handles empty state gracefully"""
+    state = context.state
+    if not state:
+        return _EMPTY_STATE_INSTRUCTION
+    return f"{_INTRO}\n{describe_user(state)}\n{_GUIDELINES}"
+
+
 # Create the agent with dynamic state handling
 dynamic_session_agent = Agent(
     name="dynamic_session_agent",
     model="gemini-2.0-flash",
-    instruction=instruction,
+    instruction=build_instruction,
     description="A dynamic session agent that handles empty state gracefully and builds context naturally"
 )
 
@@ -4,160 +4,209 @@
 Quick test to verify everything is set up correctly.
 """
 
+import argparse
 import os
+import re
 import sys
-from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
+# Folder this script lives in (plain string, resolved once at import)
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
-def check_file(path: str, description: str) -> bool:
-    """Check if a file exists"""
-    if os.path.exists(path):
-        print(f"✅ {description}")
-        return True
-    else:
-        print(f"❌ {description} - NOT FOUND")
-        return False
+# Subfolders whose files are checked
+SUBFOLDERS = (
+    "agent",
+    "1-web-ui-creator",
+    "2-rest-api-manager",
+    "3-cli-interactive",
+    "4-programmatic-examples"
+)
+
+# Paths whose mtimes decide whether a cached result is still valid: the
+# folders (entries added/removed) and agent.py (content edited in place)
+_WATCHED = (
+    _HERE,
+    *(os.path.join(_HERE, name) for name in SUBFOLDERS),
+    os.path.join(_HERE, "agent", "agent.py")
+)
+
+# Results of earlier runs in this process: key -> (all_good, output lines)
+_CACHE: Dict[Tuple, Tuple[bool, List[str]]] = {}
+
+# Everything that must exist, grouped by output section. Paths are
+# relative to this folder; a trailing "/" means it must be a directory.
+MANIFEST = (
+    ("📁 Checking folder structure...", (
+        ("agent/", "Agent folder"),
+        ("1-web-ui-creator/", "Web UI folder"),
+        ("2-rest-api-manager/", "REST API folder"),
+        ("3-cli-interactive/", "CLI folder"),
+        ("4-programmatic-examples/", "Examples folder")
+    )),
+    ("📄 Checking agent files...", (
+        ("agent/__init__.py", "Agent __init__.py"),
+        ("agent/agent.py", "Agent definition")
+    )),
+    ("🎨 Checking Web UI files...", (
+        ("1-web-ui-creator/app.py", "Streamlit app"),
+        ("1-web-ui-creator/requirements.txt", "Web UI requirements"),
+        ("1-web-ui-creator/README.md", "Web UI README")
+    )),
+    ("🔌 Checking REST API files...", (
+        ("2-rest-api-manager/session_manager.py", "SessionManager class"),
+        ("2-rest-api-manager/examples.py", "API examples"),
+        ("2-rest-api-manager/README.md", "API README")
+    )),
+    ("⌨️ Checking CLI files...", (
+        ("3-cli-interactive/create_session.py", "CLI session creator"),
+        ("3-cli-interactive/README.md", "CLI README")
+    )),
+    ("🚀 Checking example files...", (
+        ("4-programmatic-examples/multi_user_demo.py", "Multi-user demo"),
+        ("4-programmatic-examples/async_sessions.py", "Async demo"),
+        ("4-programmatic-examples/README.md", "Examples README")
+    )),
+    ("📚 Checking documentation...", (
+        ("README.md", "Main README"),
+        ("QUICKSTART.md", "Quick start guide"),
+        ("COMPARISON.md", "Comparison guide"),
+        (".env", "Environment file")
+    ))
+)
 
+# Strings agent.py must contain, and what each one proves
+AGENT_CHECKS = (
+    (b"dynamic_session_agent", "Agent name is correct"),
+    (b"root_agent", "Root agent alias exists"),
+    (b"def build_instruction", "Dynamic instruction builder present"),
+    (b"gemini-2.0-flash", "Using correct model")
+)
 
-def check_directory(path: str, description: str) -> bool:
-    """Check if a directory exists"""
-    if os.path.isdir(path):
-        print(f"✅ {description}")
-        return True
+# One alternation, one group per needle: a single pass finds them all
+_AGENT_PAT = re.compile(
+    b"|".join(b"(" + re.escape(needle) + b")" for needle, _ in AGENT_CHECKS)
+)
+
+
+def report(ok: bool, description: str, out: List[str]) -> bool:
+    """Add a check result line to out and pass the result through"""
+    if ok:
+        out.append(f"✅ {description}")
     else:
-        print(f"❌ {description} - NOT FOUND")
-        return False
+        out.append(f"❌ {description} - NOT FOUND")
+    return ok
 
 
-def main():
-    """Run all checks"""
-    print("🧪 Verifying 5.5-advanced-sessions setup...")
-    print("=" * 60)
-    
-    base_path = Path(__file__).parent
+def run_checks(out: List[str], fast: bool = False) -> bool:
+    """Run every check, appending lines to out; fast=True stops at the first failure"""
     all_good = True
     
-    # Check main folders
-    print("\n📁 Checking folder structure...")
-    folders = [
-        (base_path / "agent", "Agent folder"),
-        (base_path / "1-web-ui-creator", "Web UI folder"),
-        (base_path / "2-rest-api-manager", "REST API folder"),
-        (base_path / "3-cli-interactive", "CLI folder"),
-        (base_path / "4-programmatic-examples", "Examples folder")
-    ]
-    
-    for folder_path, desc in folders:
-        if not check_directory(str(folder_path), desc):
-            all_good = False
-    
-    # Check agent files
-    print("\n📄 Checking agent files...")
-    agent_files = [
-        (base_path / "agent" / "__init__.py", "Agent __init__.py"),
-        (base_path / "agent" / "agent.py", "Agent definition")
-    ]
-    
-    for file_path, desc in agent_files:
-        if not check_file(str(file_path), desc):
-            all_good = False
-    
-    # Check Web UI files
-    print("\n🎨 Checking Web UI files...")
-    webui_files = [
-        (base_path / "1-web-ui-creator" / "app.py", "Streamlit app"),
-        (base_path / "1-web-ui-creator" / "requirements.txt", "Web UI requirements"),
-        (base_path / "1-web-ui-creator" / "README.md", "Web UI README")
-    ]
-    
-    for file_path, desc in webui_files:
-        if not check_file(str(file_path), desc):
-            all_good = False
-    
-    # Check REST API files
-    print("\n🔌 Checking REST API files...")
-    api_files = [
-        (base_path / "2-rest-api-manager" / "session_manager.py", "SessionManager class"),
-        (base_path / "2-rest-api-manager" / "examples.py", "API examples"),
-        (base_path / "2-rest-api-manager" / "README.md", "API README")
-    ]
-    
-    for file_path, desc in api_files:
-        if not check_file(str(file_path), desc):
-            all_good = False
-    
-    # Check CLI files
-    print("\n⌨️ Checking CLI files...")
-    cli_files = [
-        (base_path / "3-cli-interactive" / "create_session.py", "CLI session creator"),
-        (base_path / "3-cli-interactive" / "README.md", "CLI README")
-    ]
-    
-    for file_path, desc in cli_files:
-        if not check_file(str(file_path), desc):
-            all_good = False
-    
-    # Check example files
-    print("\n🚀 Checking example files...")
-    example_files = [
-        (base_path / "4-programmatic-examples" / "multi_user_demo.py", "Multi-user demo"),
-        (base_path / "4-programmatic-examples" / "async_sessions.py", "Async demo"),
-        (base_path / "4-programmatic-examples" / "README.md", "Examples README")
-    ]
-    
-    for file_path, desc in example_files:
-        if not check_file(str(file_path), desc):
-            all_good = False
-    
-    # Check documentation
-    print("\n📚 Checking documentation...")
-    doc_files = [
-        (base_path / "README.md", "Main README"),
-        (base_path / "QUICKSTART.md", "Quick start guide"),
-        (base_path / "COMPARISON.md", "Comparison guide"),
-        (base_path / ".env", "Environment file")
-    ]
-    
-    for file_path, desc in doc_files:
-        if not check_file(str(file_path), desc):
-            all_good = False
+    # List each directory once; every check below is a set lookup.
+    # A subfolder is present only if it could be listed as a directory.
+    try:
+        base_names = set(os.listdir(_HERE))
+    except OSError:
+        base_names = set()
+    present: Dict[str, Set[str]] = {}
+    for name in SUBFOLDERS:
+        try:
+            present[name] = set(os.listdir(os.path.join(_HERE, name)))
+        except OSError:
+            pass  # missing, or not a directory
+    
+    for header, items in MANIFEST:
+        out.append(f"\n{header}")
+        for relpath, desc in items:
+            if relpath.endswith("/"):
+                ok = relpath[:-1] in present
+            else:
+                folder, _, name = relpath.rpartition("/")
+                ok = name in (present.get(folder, ()) if folder else base_names)
+            if not report(ok, desc, out):
+                if fast:
+                    return False
+                all_good = False
     
     # Check agent content
-    print("\n🔍 Checking agent configuration...")
-    agent_file = base_path / "agent" / "agent.py"
-    if agent_file.exists():
-        content = agent_file.read_text()
+    out.append("\n🔍 Checking agent configuration...")
+    # Open directly: a failed open already says the file is missing.
+    # Raw bytes: the needles are ASCII, so no need to decode the file.
+    try:
+        with open(os.path.join(_HERE, "agent", "agent.py"), "rb") as f:
+            content = f.read()
+    except OSError:
+        content = None
+    
+    if content is not None:
+        found = [False] * len(AGENT_CHECKS)
+        for match in _AGENT_PAT.finditer(content):
+            found[match.lastindex - 1] = True
         
-        checks = [
-            ("dynamic_session_agent", "Agent name is correct"),
-            ("root_agent", "Root agent alias exists"),
-            ("{%- if user_name %}", "Jinja2 conditionals present"),
-            ("gemini-2.0-flash", "Using correct model")
-        ]
-        
-        for check_str, desc in checks:
-            if check_str in content:
-                print(f"✅ {desc}")
-            else:
-                print(f"❌ {desc} - NOT FOUND")
+        for ok, (_, desc) in zip(found, AGENT_CHECKS):
+            if not report(ok, desc, out):
+                if fast:
+                    return False
                 all_good = False
     
+    return all_good
+
+
+def tree_key(fast: bool) -> Tuple[Optional[int], ...]:
+    """Cache key: the --fast flag plus the mtime of every watched path"""
+    key = [fast]
+    for path in _WATCHED:
+        try:
+            key.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+def main(fast: bool = False):
+    """
+    Run all checks (fast=True stops at the first failure) and return the exit code.
+    
+    Safe to import and call repeatedly: later calls in the same process
+    replay the cached result until a checked folder or agent.py changes.
+    
+    Example:
+        >>> import verify_setup
+        >>> verify_setup.main()  # runs the checks
+        >>> verify_setup.main()  # unchanged tree: replayed from _CACHE
+    """
+    # Collect every line and write once at the end instead of ~40 prints
+    out = ["🧪 Verifying 5.5-advanced-sessions setup...", "=" * 60]
+    
+    # Replay the previous result if nothing watched has changed since
+    key = tree_key(fast)
+    cached = _CACHE.get(key)
+    if cached is None:
+        lines: List[str] = []
+        cached = _CACHE[key] = (run_checks(lines, fast=fast), lines)
+    all_good, lines = cached
+    out.extend(lines)
+    
     # Summary
-    print("\n" + "=" * 60)
+    out.append("\n" + "=" * 60)
     if all_good:
-        print("✅ All checks passed! You're ready to go!")
-        print("\n🚀 Next steps:")
-        print("  1. Make sure .env has your GOOGLE_API_KEY")
-        print("  2. Run: adk web")
-        print("  3. Choose a method and create sessions!")
-        print("\n📖 Read QUICKSTART.md for detailed instructions")
+        out.append("✅ All checks passed! You're ready to go!")
+        out.append("\n🚀 Next steps:")
+        out.append("  1. Make sure .env has your GOOGLE_API_KEY")
+        out.append("  2. Run: adk web")
+        out.append("  3. Choose a method and create sessions!")
+        out.append("\n📖 Read QUICKSTART.md for detailed instructions")
     else:
-        print("❌ Some checks failed!")
-        print("\n🔧 Please fix the issues above and run again")
-    print("=" * 60)
+        out.append("❌ Some checks failed!")
+        out.append("\n🔧 Please fix the issues above and run again")
+    out.append("=" * 60)
     
+    sys.stdout.write("\n".join(out) + "\n")
     return 0 if all_good else 1
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    parser = argparse.ArgumentParser(description="Verify the 5.5-advanced-sessions setup")
+    parser.add_argument("--fast", action="store_true",
+                        help="stop at the first failed check")
+    args = parser.parse_args()
+    sys.exit(main(fast=args.fast))